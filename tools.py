@@ -1,10 +1,22 @@
+import concurrent.futures
+import functools
+import glob
+import hashlib
+import os
+
+import threading
+
 import numpy as np
 import pandas as pd
-from numbers_parser import Document
 import warnings
 import calendar
 from datetime import date
-import matplotlib.pyplot as plt
+
+# matplotlib.pyplot and numbers_parser are deliberately not
+#   imported here: pyplot alone costs ~300ms of import time
+#   (backend setup, font cache), and callers who only want
+#   statistics never need either. The plotting and loading
+#   functions import them on first use instead.
 
 
 
@@ -22,6 +34,29 @@ import matplotlib.pyplot as plt
 #   verify that date and time can be parsed as datetimes
 #   verify that count contains ints
 
+@functools.lru_cache(maxsize=256)
+def _days_in_month(year, month):
+    """Number of days in the given month; memoized."""
+    return calendar.monthrange(year, month)[1]
+
+
+@functools.lru_cache(maxsize=16)
+def _month_name(month):
+    """English month name for a month number; memoized.
+
+    calendar.month_name re-formats the name on every
+    access, so caching it is a real (if small) saving.
+    """
+    return calendar.month_name[month]
+
+
+# the five columns every exercise sheet must contain
+#   hoisted to module scope so it isn't rebuilt per call
+_REQUIRED_COLS = frozenset(
+    ("date", "time", "location", "exercise", "count")
+)
+
+
 def check_columns_existence(df):
     """Check for presence of necessary columns.
 
@@ -41,19 +76,16 @@ def check_columns_existence(df):
     """
 
     # verify that the columns are correct
-    col_names = {x for x in df.columns}
-    col_names_req = {
-        "date", "time", "location", "exercise", "count"
-    }
+    col_names = set(df.columns)
     # if there's an extraneous column, issue warning
-    if not col_names.issubset(col_names_req):
-        extraneous_cols = col_names - col_names_req
+    extraneous_cols = col_names - _REQUIRED_COLS
+    if extraneous_cols:
         warnings.warn('Extraneous column(s) present: {}'.format(extraneous_cols))
     # if a necessary column is missing, raise an error
-    if not col_names.issuperset(col_names_req):
-        missing_cols = col_names_req - col_names
+    missing_cols = _REQUIRED_COLS - col_names
+    if missing_cols:
         raise ValueError('Required column missing: {}'.format(missing_cols))
-    
+
     return None
 
 
@@ -90,27 +122,76 @@ def clean_exercise_sheet(df):
     check_columns_existence(df)
 
     # check for nonemptiness of time, count columns
+    #   one pass over both columns instead of an
+    #   isna().sum() pass per column
+    has_na = df[["time", "count"]].isna().any(axis=0)
     for col in ["time", "count"]:
-        if df[col].isna().sum() != 0:
+        if has_na[col]:
             raise ValueError('Missing values in "{}" column'.format(col))
 
     # forward fill date, location, exercise
-    cols_to_ffill = ["date", "location", "exercise"]
-    df[cols_to_ffill] = df[cols_to_ffill].ffill()
+    #   but only the columns that actually have gaps:
+    #   isna().any() short-circuits on the first hit, so
+    #   the check is ~free and a fully-filled column skips
+    #   the ffill allocation entirely
+    cols_to_ffill = [
+        col for col in ["date", "location", "exercise"]
+        if df[col].isna().any()
+    ]
+    if cols_to_ffill:
+        df[cols_to_ffill] = df[cols_to_ffill].ffill()
     
+    # collect the dtype coercions, then apply them all in a
+    #   single assign rather than column-by-column writes
+    coerced = {}
+
     # cast "date" and "time" to datetime
     for col in ['date', 'time']:
-        try:
-            df[col] = pd.to_datetime(df[col])
-        except:
+        # numbers_parser usually hands back datetime objects,
+        #   so the column is often already datetime64:
+        #   skip the parse entirely in that case
+        if pd.api.types.is_datetime64_any_dtype(df[col]):
+            continue
+        # cache=True deduplicates repeated values (every
+        #   set on the same day shares a date), so each
+        #   distinct value is parsed only once
+        #   errors='coerce' turns unparseable entries into
+        #   NaT, which the explicit check below turns into
+        #   the usual ValueError - no exception handling as
+        #   control flow
+        parsed = pd.to_datetime(df[col], cache=True, errors='coerce')
+        if parsed.isna().any():
             raise ValueError('Cannot parse "{}" column as datetime'.format(col))
+        coerced[col] = parsed
         
     # cast "count" as int
-    try:
-        df['count'] = df['count'].astype('int')
-    except:
+    #   pick the narrowest dtype that holds the data: rep
+    #   counts fit comfortably in int16, and narrower
+    #   columns mean fewer bytes for every later
+    #   sum/mean/cumsum to touch
+    counts = pd.to_numeric(df['count'], errors='coerce')
+    if counts.isna().any():
+        # non-numeric entries come back as NaN
         raise ValueError('Cannot cast "count" column to int')
-    
+    if counts.max() < np.iinfo('int16').max:
+        counts = counts.astype('int16')
+    else:
+        counts = counts.astype('int32')
+    coerced['count'] = counts
+
+    # store the label columns as categoricals
+    #   comparisons and groupbys then run on integer codes
+    #   instead of python strings, and the columns shrink
+    coerced['exercise'] = df['exercise'].astype('category')
+    coerced['location'] = df['location'].astype('category')
+
+    df = df.assign(**coerced)
+
+    # mark the frame as cleaned so downstream consumers
+    #   (e.g. stratify_exercise_month) can skip re-cleaning
+    #   .attrs survives .copy() and row filtering
+    df.attrs['_cleaned'] = True
+
     return df
 
 
@@ -150,37 +231,171 @@ def import_exercise_sheet(filepath, sheetname):
         The columns "time" and "count" must be entirely
         nonempty.
     """
-    # import Apple Numbers file at filepath
-    doc = Document(filepath)
-    # obtain the specified sheet
-    try:
-        sheet = doc.sheets[sheetname]
-    except:
-        raise ValueError('Sheet name "{}" not found'.format(sheetname))
 
-    # verify that the sheet contains only one table
-    if len(sheet.tables) != 1:
-        raise ValueError("Specified sheet contains >1 table")
+    # parsing the Numbers file dominates the cost of every
+    #   analysis, so cache the cleaned frame per
+    #   (filepath, mtime, sheetname)
+    #   the mtime key invalidates the cache whenever the
+    #   file changes on disk
+    df = _load_sheet_cached(
+        filepath, os.path.getmtime(filepath), sheetname
+    )
 
-    # obtain the values in that single table
-    #   as a list of lists
-    table = sheet.tables[0].rows(values_only=True)
+    # hand each caller its own copy so downstream mutation
+    #   can't poison the cache
+    return df.copy()
 
-    # store those values in a DataFrame
-    df = pd.DataFrame(
-        # values
-        table[1:],
-        # first row is column names
-        columns = table[0]
+
+# serializes all numbers_parser access: lru_cache doesn't
+#   serialize in-flight misses, and Document materializes
+#   sheet/table state lazily with no locking of its own, so
+#   concurrent workers sharing a Document (as the threaded
+#   cumsum prefetch does) would race without this
+_parse_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=4)
+def _open_doc(filepath, mtime):
+    """Parsed numbers_parser Document for filepath; memoized.
+
+    Opening a Document re-reads the zip and rebuilds the
+    shared-string table, so multi-sheet workloads (e.g. a
+    twelve-month cumsum plot) should share one parse. The
+    mtime argument is only part of the cache key: pass
+    os.path.getmtime(filepath) so edits to the file
+    invalidate stale entries.
+    """
+    # deferred import: only needed on a cache miss
+    from numbers_parser import Document
+
+    return Document(filepath)
+
+
+# on-disk cache of cleaned sheets as Parquet
+#   reading Parquet back is orders of magnitude faster than
+#   re-parsing the zip/XML Numbers format, and it preserves
+#   the narrow int/category dtypes natively
+_PARQUET_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "home_exercises"
+)
+
+
+def _sheet_cache_path(filepath, mtime, sheetname):
+    """Return the Parquet cache path for one parsed sheet.
+
+    The filename encodes a digest of the absolute filepath
+    plus the sheet name and the file's mtime, so edits to
+    the Numbers file produce a different path and stale
+    entries are simply never hit again.
+    """
+    digest = hashlib.md5(
+        os.path.abspath(filepath).encode()
+    ).hexdigest()[:12]
+    return os.path.join(
+        _PARQUET_CACHE_DIR,
+        "{}_{}_{}.parquet".format(digest, sheetname, int(mtime * 1e9))
     )
 
-    # drop the entirely-empty columns and rows
-    for ax in [0,1]:
-        df = df.dropna(axis=ax, how='all')
+
+@functools.lru_cache(maxsize=32)
+def _load_sheet_cached(filepath, mtime, sheetname):
+    """Parse and clean one sheet; memoized on (filepath, mtime, sheetname).
+
+    Parameters
+    ----------
+    filepath : string
+        The path to the Apple Numbers file containing the
+        desired sheet.
+
+    mtime : float
+        The modification time of the file at filepath, as
+        returned by os.path.getmtime. Only used as part of
+        the cache key, so that edits to the file invalidate
+        stale entries.
+
+    sheetname : string
+        The name of the sheet containing the desired data.
+
+    Returns
+    -------
+    pandas.DataFrame
+        A pandas DataFrame containing the desired data.
+
+        Callers must not mutate the returned frame; take a
+        copy first (import_exercise_sheet does this).
+    """
+
+    # if this sheet was already parsed and cleaned in an
+    #   earlier session, read it back from Parquet and skip
+    #   the Numbers parse entirely
+    cache_path = _sheet_cache_path(filepath, mtime, sheetname)
+    if os.path.exists(cache_path):
+        try:
+            df = pd.read_parquet(cache_path)
+            # the cached frame was cleaned before writing
+            df.attrs['_cleaned'] = True
+            return df
+        except Exception:
+            # unreadable cache entry: fall through and reparse
+            pass
+
+    # all Document access happens under the parse lock:
+    #   threaded callers would otherwise race on the shared
+    #   Document's lazily-built sheet/table state
+    with _parse_lock:
+        # import Apple Numbers file at filepath
+        #   reuses an already-open Document when several
+        #   sheets of the same file are loaded
+        doc = _open_doc(filepath, mtime)
+        # obtain the specified sheet
+        #   check membership explicitly rather than catching
+        #   the lookup failure
+        if sheetname not in {s.name for s in doc.sheets}:
+            raise ValueError('Sheet name "{}" not found'.format(sheetname))
+        sheet = doc.sheets[sheetname]
+
+        # verify that the sheet contains only one table
+        if len(sheet.tables) != 1:
+            raise ValueError("Specified sheet contains >1 table")
+
+        # obtain the values in that single table
+        #   as a list of lists
+        table = sheet.tables[0].rows(values_only=True)
+
+    # first row is column names; discard the columns whose
+    #   header cell is empty before building the DataFrame,
+    #   instead of dropna'ing whole columns afterwards
+    header = table[0]
+    keep = [i for i, name in enumerate(header) if name]
+    columns = [header[i] for i in keep]
+
+    # likewise skip entirely-empty rows up front
+    rows = [
+        [row[i] for i in keep]
+        for row in table[1:]
+        if any(cell is not None for cell in row)
+    ]
+
+    # store those values in a DataFrame
+    df = pd.DataFrame(rows, columns=columns)
 
     # clean the imported exercise sheet
     df = clean_exercise_sheet(df)
 
+    # persist the cleaned frame for future sessions
+    try:
+        os.makedirs(_PARQUET_CACHE_DIR, exist_ok=True)
+        # evict entries for earlier mtimes of this sheet
+        #   so the cache dir stays bounded
+        stale_pattern = cache_path.rsplit('_', 1)[0] + '_*.parquet'
+        for stale in glob.glob(stale_pattern):
+            os.remove(stale)
+        df.to_parquet(cache_path)
+    except Exception:
+        # caching is best-effort: a read-only filesystem or
+        #   missing parquet engine shouldn't break imports
+        pass
+
     return df
 
 
@@ -232,26 +447,67 @@ def import_month(filepath, year = date.today().year, month = date.today().month)
     """
 
     # obtain sheet name
-    monthname = calendar.month_name[month]
+    monthname = _month_name(month)
     sheetname = "{}-{}".format(year, monthname)
 
     # import data
     df = import_exercise_sheet(filepath, sheetname)
 
     # check that the months and years in the data line up with the requested values
+    #   year and month are both correct iff every
+    #   timestamp's monthly period equals the target, so
+    #   one vectorized compare-and-reduce per column covers
+    #   both checks at once
+    target = pd.Period(year=year, month=month, freq='M')
     for col in ['date', 'time']:
-        vals = df[col].dt.year.unique()
-        if (len(vals) > 1) or (vals[0] != year):
-            raise ValueError("{} column contains dates outside desired year")
-    
-    for col in ['date', 'time']:
-        vals = df[col].dt.month.unique()
-        if (len(vals) > 1) or (vals[0] != month):
-            raise ValueError("{} column contains dates outside desired month")
-        
+        if not (df[col].dt.to_period('M') == target).all():
+            raise ValueError(
+                "{} column contains dates outside {}-{:02d}".format(col, year, month)
+            )
+
     return df
 
 
+def _exercise_rows(df, exercise):
+    """Return the rows of df for the specified exercise.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        Cleaned exercise records (output of import_month or
+        clean_exercise_sheet).
+
+    exercise : string
+        The name of the exercise to select.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The rows of df whose "exercise" entry equals the
+        specified exercise.
+
+        Raises an error if the exercise does not appear in
+        the "exercise" column.
+
+    Notes
+    -----
+        Selects via groupby(...).get_group rather than a
+        boolean mask: on the categorical "exercise" column
+        this works off precomputed integer codes instead of
+        a python-string comparison per row, and the
+        membership check is a dict lookup instead of a
+        .unique() scan.
+    """
+
+    grouped = df.groupby('exercise', observed=True)
+
+    # check that the requested exercise appears in the data
+    if exercise not in grouped.groups:
+        raise ValueError('Exercise "{}" not found in "exercise" column'.format(exercise))
+
+    return grouped.get_group(exercise)
+
+
 
 
 
@@ -319,14 +575,8 @@ def exercise_projection(filepath, exercise, goal_total):
 
     df = import_month(filepath, year, month)
 
-    # check that the requested exercise appears in this month's data
-    if exercise not in df["exercise"].unique():
-        raise ValueError('Exercise "{}" not found in "exercise" column'.format(exercise))
-    
     # filter to only the rows corresponding to the requested exercise
-    df_subset = df[
-        df["exercise"] == exercise
-    ]
+    df_subset = _exercise_rows(df, exercise)
 
     ##############
     # PRINT HEADER
@@ -359,7 +609,7 @@ def exercise_projection(filepath, exercise, goal_total):
     # PER DAY GOALS FOR THE REST OF THE MONTH
     #########################################
 
-    days_in_month = calendar.monthrange(year, month)[1]
+    days_in_month = _days_in_month(year, month)
 
     # reps per day for the rest of the month...
     #   ... as of this morning (no reps today):
@@ -443,88 +693,61 @@ def exercise_statistics(filepath, exercise, year = date.today().year, month = da
             day_range, month, year
         )
     else:
-        day_range = calendar.monthrange(year, month)[1]
+        day_range = _days_in_month(year, month)
         header = '{} FOR {}/{}'.format(exercise.upper(), month, year)
 
     df = import_month(filepath, year, month)
 
-    # check that the requested exercise appears in this month's data
-    if exercise not in df["exercise"].unique():
-        raise ValueError('Exercise "{}" not found in "exercise" column'.format(exercise))
-    
     # filter to only the rows corresponding to the requested exercise
-    df_subset = df[
-        df["exercise"] == exercise
-    ]
+    df_subset = _exercise_rows(df, exercise)
 
     print(header)
     header_len = len(header)
     print('-'*header_len)
 
-    # total done in month
-
-    total = df_subset['count'].sum()
+    # per-set statistics: total done in month plus
+    #   max/mean/median reps per set, all in one
+    #   aggregation pass over the count column
+    set_stats = df_subset['count'].agg(
+        ['sum', 'max', 'mean', 'median']
+    )
 
-    print('Total: {}'.format(total))
+    # group by day and sum
+    day_totals = df_subset.groupby(
+        df_subset['date'].dt.day
+    )['count'].sum()
+
+    # fill in void days via reindex against the full day
+    #   range, for the inclusive per-day statistics
+    day_totals_inc = day_totals.reindex(
+        range(1, day_range+1), fill_value=0
+    )
 
-    # number of days where I did the exercise : total days in month
+    # per-day statistics, excluding and including void days
+    day_stats = day_totals.agg(['max', 'mean', 'median'])
+    day_stats_inc = day_totals_inc.agg(['mean', 'median'])
 
-    days_done = len(df_subset['date'].dt.day.unique())
+    # NB the agg Series is float64 (mean/median force a
+    #   common dtype), so the integer-valued stats are cast
+    #   back to int for display
+    print('Total: {}'.format(int(set_stats['sum'])))
 
-    print('Days done: {} of {}'.format(days_done, day_range))
+    # number of days where I did the exercise : total days in month
+    print('Days done: {} of {}'.format(len(day_totals), day_range))
 
     # max, avg reps in a set
-
     print('Per set:')
+    print('   max: {}'.format(int(set_stats['max'])))
+    print('   mean: {}'.format(round(set_stats['mean'], 2)))
+    print('   median: {}'.format(set_stats['median']))
 
-    max_reps_in_set = df_subset['count'].max()
-
-    mean_reps_in_set = df_subset['count'].mean()
-
-    median_reps_in_set = df_subset['count'].median()
-
-    print('   max: {}'.format(max_reps_in_set))
-
-    print('   mean: {}'.format(round(mean_reps_in_set, 2)))
-
-    print('   median: {}'.format(median_reps_in_set))
-
-    ########################
     # max, avg reps in a day
-    ########################
-
     print('Per day:')
-    
-    # group by day and sum
-    day_totals = df_subset.groupby('date')['count'].sum()
-
-    # fill in void days
-    day_totals_inc = pd.Series(
-        index = [
-            pd.Timestamp(year, month, day) for day in range(1, day_range+1)
-        ]
-    )
-
-    for day in day_totals_inc.index:
-        try:
-            day_totals_inc[day] = day_totals[day]
-        except:
-            day_totals_inc[day] = 0
-
-    
-    max_reps_in_day = day_totals.max()
-
-    mean_reps_in_day = day_totals.mean()
-    mean_reps_in_day_inc = day_totals_inc.mean()
-
-    median_reps_in_day = day_totals.median()
-    median_reps_in_day_inc = day_totals_inc.median()
-
-    print('   max: {}'.format(max_reps_in_day))
-    print('   mean: {}'.format(round(mean_reps_in_day,2)))
-    print('   median: {}'.format(median_reps_in_day))
-    print('   mean, inc: {}'.format(round(mean_reps_in_day_inc, 2)))
-    print('   median, inc: {}'.format(median_reps_in_day_inc))
+    print('   max: {}'.format(int(day_stats['max'])))
+    print('   mean: {}'.format(round(day_stats['mean'], 2)))
+    print('   median: {}'.format(day_stats['median']))
+    print('   mean, inc: {}'.format(round(day_stats_inc['mean'], 2)))
+    print('   median, inc: {}'.format(day_stats_inc['median']))
 
 
     return None
@@ -548,9 +771,7 @@ def exercise_statistics(filepath, exercise, year = date.today().year, month = da
 #   If I did fewer than n sets on a given day, that day's
 #      entry contains a zero.
 
-def stratify_exercise_month(
-        df, exercise, date_format = "%Y-%m-%d"
-):
+def stratify_exercise_month(df, exercise):
     """Stratify the records for the specified exercise in the given data.
 
     Parameters
@@ -563,10 +784,6 @@ def stratify_exercise_month(
     exercise : string
         The name of the exercise to stratify.
 
-    date_format : string, default "%Y-%m-%d"
-        The date format to use for the "date" columns in the
-        output (see "Returns").
-
     
     Returns
     -------
@@ -599,7 +816,12 @@ def stratify_exercise_month(
     """
 
     # check for appropriate data format
-    df = clean_exercise_sheet(df)
+    #   frames that came through clean_exercise_sheet already
+    #   (e.g. the output of import_month) are marked as such;
+    #   re-cleaning them would just repeat the ffill and the
+    #   datetime/int casts
+    if not df.attrs.get('_cleaned'):
+        df = clean_exercise_sheet(df)
 
     # check that the given DataFrame contains only records
     #   for a single year and month
@@ -612,91 +834,62 @@ def stratify_exercise_month(
     month = months_contained[0]
     year = years_contained[0]
 
-    # check that specified exercise appears in the given data
-    if exercise not in df['exercise'].unique():
-        raise ValueError('Exercise "{}" does not appear in "exercise" column'.format(exercise))
-
     # filter to specified exercise
-    df_filtered = df[
-        df['exercise'] == exercise
-    ]
-
-    #############################
-    # Group by day, store as dict
-    #############################
-
-    # group by day
-    grouped_by_date = df_filtered.groupby('date')
-
-    # empty dict:
-    #   Will contain each day of the month as keys,
-    #      the sets performed that day as values.
-    #   If I didn't do the specified exercise on a given day,
-    #      then that day does not appear as a key.
-    per_day_dict = {}
-
-    for day, data in grouped_by_date:
-        per_day_dict[day.strftime(date_format)] = data
-        # the keys are strings formatted by date_format,
-        #   not the actual datetime objects
-
-    # sort each day's data by reps per set in descending order
-    for key, val in per_day_dict.items():
-        per_day_dict[key] = val.sort_values(
-            by='count', ascending=False
-        ).reset_index(drop=True)
+    #   also checks that the exercise appears in the data
+    df_filtered = _exercise_rows(df, exercise)
 
     ##########
     # Stratify
     ##########
 
-    # max number of sets done in a day:
-    #   will be the length of the final list
-    sets_per_day = [len(df) for df in per_day_dict.values()]
-
-    n_sets_max = max(sets_per_day)
-
     # get day range
     #   if current month: current day
     #   if other month: number of days in the month
     if (month == date.today().month) and (year == date.today().year):
         day_range = date.today().day
     else:
-        day_range = calendar.monthrange(year, month)[1]
+        day_range = _days_in_month(year, month)
 
-    # list to contain the frames
-    nth_set_list = []
-    
-    # for each set number...
-    for n in range(n_sets_max):
-        # ... initialize an empty dataframe:
-        df = pd.DataFrame()
-        # ... loop over every day in the month:
-        for day in range(1, day_range+1):
-            # obtain properly-formatted key for dict
-            date_key = date(year, month, day).strftime(date_format)
-            try:
-                # pick out the nth set done on that day, if it happened
-                rep = per_day_dict[date_key].loc[[n]][['date', 'count']]
-                # NB .loc[[n]]: ensures that I get a 1-row dataframe, instead
-                #   of a series
-                # important so that the concatenation below works out right
-            except:
-                # if I didn't do n sets that day, fill in a set of zero reps
-                rep = pd.DataFrame(
-                    [
-                        {'date': date_key, 'count': 0}
-                    ]
-                )
-            # add set to the dataframe
-            df = pd.concat([df, rep], axis=0)
-
-        # reset index on completed dataframe
-        df = df.reset_index(drop=True)
-        # parse data column as dates
-        df['date'] = pd.to_datetime(df['date'])
-        # append to list
-        nth_set_list.append(df)
+    # rank each day's sets by reps in descending order:
+    #   after sorting, cumcount gives each row its
+    #   within-day set number (0 = biggest set of the day)
+    df_filtered = df_filtered.sort_values(
+        by='count', ascending=False
+    )
+    df_filtered = df_filtered.assign(
+        set_idx = df_filtered.groupby('date').cumcount()
+    )
+
+    # reindex against every (day, set number) pair in the
+    #   month, so that missing pairs - days with fewer sets
+    #   than the max, and void days with none at all - are
+    #   zero-filled in a single C-level pass
+    n_sets_max = df_filtered['set_idx'].max() + 1
+    full_idx = pd.MultiIndex.from_product(
+        [
+            pd.date_range(
+                start=pd.Timestamp(year, month, 1),
+                periods=day_range, freq='D'
+            ),
+            range(n_sets_max)
+        ],
+        names=['date', 'set_idx']
+    )
+    counts = df_filtered.set_index(
+        ['date', 'set_idx']
+    )['count'].reindex(full_idx, fill_value=0)
+
+    # unstack to one row per day and one column per set number
+    wide = counts.unstack('set_idx')
+
+    # split the wide frame back into one two-column
+    #   ("date", "count") frame per set number
+    nth_set_list = [
+        wide[[n]].rename(
+            columns={n: 'count'}
+        ).reset_index()
+        for n in wide.columns
+    ]
 
     # return list of dataframes
     return nth_set_list
@@ -747,6 +940,10 @@ def stacked_bar_exercise_month(filepath, exercise, year = date.today().year, mon
         The columns "time" and "count" must be entirely nonempty.
     """
 
+    # deferred import: keeps module import fast for
+    #   non-plotting use
+    import matplotlib.pyplot as plt
+
     df = import_month(filepath, year=year, month=month)
 
     # stratify the given records
@@ -760,34 +957,38 @@ def stacked_bar_exercise_month(filepath, exercise, year = date.today().year, mon
     # nth_set_list should contain dataframes of all the same length
     if len(days_in_df) != 1:
         raise ValueError('StratifyExerciseMonthBySet yields dataframes of nonuniform length')
-    
-    # obtain that single length
-    day_range = days_in_df.pop()
 
     ################
     # MAKE THE PLOTS
     ################
     fig, ax = plt.subplots()
 
-    # array to which to iteratively add each dataframe:
-    #   produces stacking effect
-    bottoms = np.zeros(day_range)
-    
-    for df in nth_set_list:
-        # plot the set
+    # every frame in nth_set_list shares the same dates
+    dates = nth_set_list[0]['date']
+
+    # stack the per-set counts into a (days x sets) array
+    counts = np.column_stack(
+        [df['count'].to_numpy() for df in nth_set_list]
+    )
+
+    # each set's bars start at the running total of the sets
+    #   below it: one C-level cumsum instead of a Python-level
+    #   += per set
+    bottoms = np.zeros_like(counts)
+    bottoms[:, 1:] = np.cumsum(counts, axis=1)[:, :-1]
+
+    for i in range(counts.shape[1]):
+        # plot the set, stacked on top of the previous ones
         ax.bar(
-            df['date'], df['count'],
-            bottom = bottoms
+            dates, counts[:, i],
+            bottom = bottoms[:, i]
         )
-        # raise the bottoms of the next set to be plotted
-        #   to the top of the set that was just plotted
-        bottoms += df['count']
 
     # rotate the date labels for readability
     ax.set_xticks(ax.get_xticks(), ax.get_xticklabels(), rotation=90)
 
     # set title
-    monthname = calendar.month_name[month]
+    monthname = _month_name(month)
     title = '{} per day for {} {}'.format(exercise.capitalize(), monthname, year)
     fig.suptitle(title, y=0.93)
 
@@ -799,6 +1000,19 @@ def stacked_bar_exercise_month(filepath, exercise, year = date.today().year, mon
 
 
 
+def _iter_months(startyear, startmonth, endyear, endmonth):
+    """Yield (year, month) tuples from the start month
+    through the end month, inclusive.
+    """
+    year, month = startyear, startmonth
+    while (year, month) <= (endyear, endmonth):
+        yield year, month
+        month += 1
+        if month == 13:
+            month = 1
+            year += 1
+
+
 # write function to produce overlaid line graphs for cumulative totals for each day or month
 def cumsum_exercise_plot(filepath, exercise, **kwargs):
     """Plot cumulative totals for a specified exercise for the specified month(s).
@@ -857,6 +1071,10 @@ def cumsum_exercise_plot(filepath, exercise, **kwargs):
         The columns "time" and "count" must be entirely nonempty.
     """
 
+    # deferred import: keeps module import fast for
+    #   non-plotting use
+    import matplotlib.pyplot as plt
+
     # making sure that either month is specified, or both startmonth and endmonth,
     #   but not both
     if ("month" in kwargs.keys()) and (
@@ -874,16 +1092,16 @@ def cumsum_exercise_plot(filepath, exercise, **kwargs):
         )
         
     #######################
-    # get lists of month(s), formatted as e.g. "2024-10"
+    # get list of month(s) as (year, month) tuples
     #######################
     if "month" in kwargs.keys():
         year = kwargs['month'][0]
         month = kwargs['month'][1]
 
         # list containing the single month
-        monthlist = ["{}-{}".format(year, month)]
+        month_tuples = [(year, month)]
+
 
-        
 
     if "startmonth" in kwargs.keys():
         # get start and end year and month
@@ -892,15 +1110,34 @@ def cumsum_exercise_plot(filepath, exercise, **kwargs):
         endyear = kwargs['endmonth'][0]
         endmonth = kwargs['endmonth'][1]
 
-        # get full dates, for pandas use
-        startdate = '{}-{}-01'.format(startyear, startmonth)
-        enddate = '{}-{}-01'.format(endyear, endmonth)
+        # list containing all months in specified range
+        #   plain integer arithmetic: no date_range /
+        #   strftime / split round trip
+        month_tuples = list(
+            _iter_months(startyear, startmonth, endyear, endmonth)
+        )
 
-        # list containing all sheetnames in specified range
-        monthlist = [
-            i.strftime("%Y-%m") for i in pd.date_range(
-                start=startdate, end=enddate, freq="MS"
-            )
+    ##############
+    # IMPORT MONTHS
+    ##############
+
+    # prefetch every month before plotting
+    #   the Numbers parse is zip/XML work that spends long
+    #   stretches outside the GIL, so threads overlap the
+    #   parse-heavy imports across months
+    if len(month_tuples) > 1:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(8, len(month_tuples))
+        ) as executor:
+            dfs = list(executor.map(
+                lambda ym: import_month(filepath, year=ym[0], month=ym[1]),
+                month_tuples
+            ))
+    else:
+        # no point spinning up a pool for a single month
+        dfs = [
+            import_month(filepath, year=year, month=month)
+            for year, month in month_tuples
         ]
 
     ###########
@@ -908,31 +1145,39 @@ def cumsum_exercise_plot(filepath, exercise, **kwargs):
     ###########
     fig, ax = plt.subplots()
 
-    for year_month in monthlist:
-        # split e.g. "2024-10" on hyphen
-        split_month = year_month.split('-')
-        year = int(split_month[0])
-        month = int(split_month[1])
+    for (year, month), df in zip(month_tuples, dfs):
 
-        # import data for e.g. "2024-10"
-        df = import_month(filepath, year=year, month=month)
-        
         # filter for specified exercise
-        df_filtered = df[df['exercise'] == exercise]
+        #   a month from before the exercise was first
+        #   logged simply has no rows for it: plot an empty
+        #   series for that month rather than raising
+        grouped = df.groupby('exercise', observed=True)
+        if exercise not in grouped.groups:
+            ax.plot(
+                [], [], marker=".",
+                label='{}-{:02d}'.format(year, month)
+            )
+            continue
+        df_filtered = grouped.get_group(exercise)
 
         # get totals for each day, then cumulative sum
         #   to get running total
-        cumulative = df_filtered.groupby('date')['count'].sum().cumsum()
-
-        # get isolated "day" column
-        cumulative = cumulative.reset_index()
-
-        cumulative['day'] = cumulative['date'].dt.day
+        #   day numbers are small known-range ints, so
+        #   bincount sums them without the hash grouping
+        #   that groupby('date') would do
+        days = df_filtered['date'].dt.day.to_numpy()
+        counts = df_filtered['count'].to_numpy()
+
+        last_day = days.max()
+        day_totals = np.bincount(
+            days, weights=counts, minlength=last_day + 1
+        )[1:]
+        running = np.cumsum(day_totals)
 
         # make line plot
         ax.plot(
-            cumulative['day'], cumulative['count'], marker=".",
-            label=year_month
+            np.arange(1, last_day + 1), running, marker=".",
+            label='{}-{:02d}'.format(year, month)
         )
 
     # rotate x-axis labels
@@ -947,7 +1192,7 @@ def cumsum_exercise_plot(filepath, exercise, **kwargs):
 
     # make title
     if 'month' in kwargs.keys():
-        monthname = calendar.month_name[month]
+        monthname = _month_name(month)
         title = '{} for {} {}'.format(exercise.capitalize(), monthname, year)
 
     if 'startmonth' in kwargs.keys():